@@ -0,0 +1,121 @@
+"""
+Caché en memoria de las colas FIFO de misiones pendientes
+
+Mantiene una ColaMisiones (deque) por personaje delante de la tabla
+personaje_misiones_pendientes:
+- Lectura de la cabeza de la cola en O(1) sin consultar SQLite
+- Carga perezosa por personaje (o precarga completa al arrancar)
+- Un lock por personaje serializa las operaciones sobre su cola
+
+La tabla SQL sigue siendo la fuente persistente: las escrituras se hacen
+en la misma transacción y la caché solo se actualiza tras el commit.
+La caché es por proceso, por lo que asume un único worker de uvicorn.
+"""
+import threading
+from collections import defaultdict
+from contextlib import contextmanager
+
+from sqlalchemy import select
+
+from database import personaje_misiones_pendientes
+from tda_cola import ColaMisiones
+
+
+class CacheColas:
+    """Colas de misiones pendientes indexadas por personaje_id
+
+    Atributos:
+        colas: dict {personaje_id: ColaMisiones} con las colas cargadas
+        locks: dict {personaje_id: Lock} para serializar cada cola
+
+    Ejemplo:
+        >>> with cache.bloquear(1):
+        ...     siguiente = cache.obtener(db, 1).first()
+        ...     # ... DELETE en SQL + commit ...
+        ...     cache.desencolar(1)
+    """
+    def __init__(self):
+        self.colas = {}
+        self.locks = defaultdict(threading.Lock)
+        self._lock_global = threading.Lock()
+
+    @contextmanager
+    def bloquear(self, personaje_id: int):
+        """Bloquea la cola de un personaje durante una operación completa
+
+        Si la operación falla, la cola se descarta para recargarla desde SQL.
+
+        Args:
+            personaje_id: ID del personaje
+        """
+        with self._lock_global:
+            lock = self.locks[personaje_id]
+        with lock:
+            try:
+                yield
+            except BaseException:
+                self.invalidar(personaje_id)
+                raise
+
+    def obtener(self, db, personaje_id: int):
+        """Retorna la cola del personaje, cargándola desde SQL si falta
+
+        Args:
+            db: Sesión de base de datos
+            personaje_id: ID del personaje
+
+        Returns:
+            ColaMisiones: Cola FIFO de IDs de misiones pendientes
+        """
+        cola = self.colas.get(personaje_id)
+        if cola is None:
+            cola = ColaMisiones()
+            for mision_id in db.scalars(
+                select(personaje_misiones_pendientes.c.mision_id)
+                .where(personaje_misiones_pendientes.c.personaje_id == personaje_id)
+                .order_by(personaje_misiones_pendientes.c.orden)
+            ):
+                cola.enqueue(mision_id)
+            self.colas[personaje_id] = cola
+        return cola
+
+    def precargar(self, db):
+        """Carga todas las colas con una sola consulta (arranque en caliente)
+
+        Args:
+            db: Sesión de base de datos
+        """
+        colas = defaultdict(ColaMisiones)
+        for personaje_id, mision_id in db.execute(
+            select(
+                personaje_misiones_pendientes.c.personaje_id,
+                personaje_misiones_pendientes.c.mision_id
+            ).order_by(
+                personaje_misiones_pendientes.c.personaje_id,
+                personaje_misiones_pendientes.c.orden
+            )
+        ):
+            colas[personaje_id].enqueue(mision_id)
+        self.colas = dict(colas)
+
+    def encolar(self, personaje_id: int, mision_id: int):
+        """Añade una misión al final de la cola cacheada (si está cargada)"""
+        cola = self.colas.get(personaje_id)
+        if cola is not None:
+            cola.enqueue(mision_id)
+
+    def desencolar(self, personaje_id: int):
+        """Remueve la primera misión de la cola cacheada (si está cargada)"""
+        cola = self.colas.get(personaje_id)
+        if cola is not None:
+            cola.dequeue()
+
+    def invalidar(self, personaje_id=None):
+        """Descarta la cola de un personaje, o todas si no se indica ID"""
+        if personaje_id is None:
+            self.colas = {}
+        else:
+            self.colas.pop(personaje_id, None)
+
+
+cache_colas = CacheColas()
@@ -2,7 +2,7 @@
 CONFIGURACIÓN DE BASE DE DATOS RPG - SQLAlchemy
 
 Componentes principales:
-- Motor SQLite: sqlite:///./rpg.db
+- Motor SQLite: sqlite:///./rpg.db (pool de conexiones + WAL)
 - SessionLocal: Fábrica de sesiones
 - Base: Modelos declarativos
 - Modelos: 
@@ -11,18 +11,51 @@ Componentes principales:
 - Funcionalidad:
   * get_db(): Generador de sesiones para FastAPI
 """
-from sqlalchemy import create_engine, Column, Integer, String, ForeignKey, Table
+import logging
+import os
+
+from sqlalchemy import create_engine, event, Column, Integer, String, ForeignKey, Table, Index
 from sqlalchemy.orm import relationship, sessionmaker, declarative_base
+from sqlalchemy.pool import QueuePool
 
 SQLALCHEMY_DATABASE_URL = "sqlite:///./rpg.db"
 
+# Pool de conexiones: cada hilo de FastAPI usa su propia conexión (WAL)
+POOL_SIZE = 8
+MAX_OVERFLOW = 16
+
+# El eco de SQL solo se activa en desarrollo con SQL_ECHO=1
 engine = create_engine(
     SQLALCHEMY_DATABASE_URL,
-    connect_args={"check_same_thread": False},
-    echo=True
+    connect_args={"check_same_thread": False, "timeout": 30},
+    poolclass=QueuePool,
+    pool_size=POOL_SIZE,
+    max_overflow=MAX_OVERFLOW,
+    pool_pre_ping=False,
+    echo=os.getenv("SQL_ECHO") == "1"
 )
+logging.getLogger("sqlalchemy.engine").setLevel(logging.WARNING)
+
+@event.listens_for(engine, "connect")
+def _configurar_sqlite(dbapi_connection, connection_record):
+    """Aplica los PRAGMA de SQLite una vez por conexión física
+
+    - journal_mode=WAL: lectores concurrentes con un escritor
+    - synchronous=NORMAL: menos fsync por commit (seguro con WAL)
+    - temp_store/cache_size: tablas temporales y caché en memoria
+    - foreign_keys=ON: respeta los ondelete="CASCADE"
+    """
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.execute("PRAGMA cache_size=-20000")
+    cursor.execute("PRAGMA foreign_keys=ON")
+    cursor.close()
 
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# expire_on_commit=False: tras el commit los objetos conservan sus valores
+# y armar la respuesta no dispara un SELECT de recarga
+SessionLocal = sessionmaker(autocommit=False, autoflush=False, expire_on_commit=False, bind=engine)
 
 Base = declarative_base()
 
@@ -39,7 +72,8 @@ personaje_misiones_pendientes = Table(
     Base.metadata,
     Column('personaje_id', Integer, ForeignKey('personajes.id', ondelete="CASCADE"), primary_key=True),
     Column('mision_id', Integer, ForeignKey('misiones.id', ondelete="CASCADE"), primary_key=True),
-    Column('orden', Integer)  # Para mantener orden FIFO
+    Column('orden', Integer),  # Para mantener orden FIFO
+    Index('ix_pend_pid_orden', 'personaje_id', 'orden')  # Cabeza/cola de la cola FIFO
 )
 
 # Definir modelos aquí mismo para evitar importaciones circulares
@@ -53,7 +87,7 @@ class Personaje(Base):
     """
     __tablename__ = 'personajes'
     id = Column(Integer, primary_key=True)
-    nombre = Column(String)
+    nombre = Column(String, index=True, unique=True)
     xp = Column(Integer, default=0)
     mision_activa_id = Column(Integer, ForeignKey('misiones.id'), nullable=True)
     
@@ -15,74 +15,116 @@ Endpoints principales:
 Autenticación: Actualmente no implementada
 """
 
-from fastapi import FastAPI, HTTPException, Depends, Query
+from anyio import to_thread
+from fastapi import FastAPI, HTTPException, Depends, Header, Response
+from fastapi.responses import ORJSONResponse
 from sqlalchemy import func, select, text
-from sqlalchemy.orm import Session, joinedload
-from database import SessionLocal, engine, get_db, Personaje, Mision, personaje_misiones_completadas, personaje_misiones_pendientes, Base
-from pydantic import BaseModel
-from typing import List
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session, joinedload, selectinload, load_only
+from cache_colas import cache_colas
+from database import SessionLocal, engine, get_db, POOL_SIZE, MAX_OVERFLOW, Personaje, Mision, personaje_misiones_completadas, personaje_misiones_pendientes, Base
+from pydantic import BaseModel, Field
+from typing import List, Optional
 
-app = FastAPI()
+# orjson serializa las respuestas directamente a bytes (más rápido que json)
+app = FastAPI(default_response_class=ORJSONResponse)
 
 from fastapi import HTTPException
+import hashlib
 import logging
+import orjson
 
 # Configurar logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+class PersonajeIn(BaseModel):
+    """Datos de entrada para crear un personaje (validados por pydantic)"""
+    nombre: str = Field(min_length=1, max_length=64)
+
+class MisionIn(BaseModel):
+    """Datos de entrada para crear una misión (validados por pydantic)"""
+    titulo: str = Field(min_length=3)
+    xp: int = Field(gt=0)
+
+def consulta_misiones_disponibles(personaje_id: int, mision_activa_id=None):
+    """Construye la consulta de misiones asignables a un personaje
+
+    Excluye en un único conjunto (UNION ALL) las misiones pendientes y
+    completadas del personaje, además de su misión activa.
+
+    Args:
+        personaje_id (int): ID del personaje
+        mision_activa_id (int|None): ID de la misión activa, si tiene
+
+    Returns:
+        Select: Consulta que devuelve filas (id, titulo, xp)
+    """
+    excluidas = select(personaje_misiones_pendientes.c.mision_id).where(
+        personaje_misiones_pendientes.c.personaje_id == personaje_id
+    ).union_all(
+        select(personaje_misiones_completadas.c.mision_id).where(
+            personaje_misiones_completadas.c.personaje_id == personaje_id
+        )
+    )
+    consulta = select(Mision.id, Mision.titulo, Mision.xp).where(
+        Mision.id.notin_(excluidas)
+    )
+    if mision_activa_id:
+        consulta = consulta.where(Mision.id != mision_activa_id)
+    return consulta
+
+@app.get("/healthz")
+def healthz(db: Session = Depends(get_db)):
+    """
+    Verifica que la API y la conexión a la base de datos estén activas
+
+    Returns:
+        dict: {"status": "ok"} si la base de datos responde
+
+    Raises:
+        HTTPException: 503 si la base de datos no responde
+    """
+    try:
+        db.execute(text("SELECT 1"))
+        return {"status": "ok"}
+    except Exception as e:
+        logger.error(f"Error en healthz: {str(e)}", exc_info=True)
+        raise HTTPException(
+            status_code=503,
+            detail="Base de datos no disponible"
+        )
+
 @app.get("/personajes")
 def listar_personajes(db: Session = Depends(get_db)):
     try:
         logger.info("Iniciando consulta de personajes")
-        
-        # Verificación de conexión a la base de datos
-        # Se ejecuta una consulta simple para confirmar que la conexión está activa
-        db.execute(text("SELECT 1"))
-        logger.info("Conexión a la base de datos verificada")
 
-        # Consulta para obtener todos los personajes con sus atributos básicos:
+        # Consulta única (LEFT OUTER JOIN) con los atributos básicos de
+        # cada personaje y el título de su misión activa:
         # - ID
         # - Nombre
         # - XP
-        # - ID de misión activa
-        personajes = db.query(
-            Personaje.id,
-            Personaje.nombre,
-            Personaje.xp,
-            Personaje.mision_activa_id
+        # - ID y título de misión activa (NULL si no tiene)
+        personajes = db.execute(
+            select(
+                Personaje.id,
+                Personaje.nombre,
+                Personaje.xp,
+                Personaje.mision_activa_id,
+                Mision.titulo
+            ).outerjoin(Mision, Personaje.mision_activa_id == Mision.id)
         ).all()
         logger.info(f"Encontrados {len(personajes)} personajes")
 
-        if not personajes:
-            return []
-
-        # Obtener IDs de misiones activas de todos los personajes
-        # Filtramos los personajes que no tienen misión activa (mision_activa_id es None)
-        mision_ids = [p.mision_activa_id for p in personajes if p.mision_activa_id]
-        
-        # Consulta para obtener detalles de las misiones activas
-        # Solo se ejecuta si hay al menos un personaje con misión activa
-        misiones_activas = {}
-        if mision_ids:
-            misiones = db.query(
-                Mision.id,
-                Mision.titulo
-            ).filter(Mision.id.in_(mision_ids)).all()
-            
-            # Convertimos los resultados a un diccionario {id: misión}
-            # para fácil acceso posterior
-            misiones_activas = {m.id: m for m in misiones}
-            logger.info(f"Encontradas {len(misiones_activas)} misiones activas")
-
         return [{
             "id": p.id,
             "nombre": p.nombre,
             "xp": p.xp,
             "mision_activa": {
                 "id": p.mision_activa_id,
-                "titulo": misiones_activas[p.mision_activa_id].titulo
-            } if p.mision_activa_id and p.mision_activa_id in misiones_activas else None
+                "titulo": p.titulo
+            } if p.mision_activa_id and p.titulo is not None else None
         } for p in personajes]
 
     except Exception as e:
@@ -93,13 +135,13 @@ def listar_personajes(db: Session = Depends(get_db)):
         )
 
 @app.post("/personajes")
-def crear_personaje(personaje: dict, db: Session = Depends(get_db)):
+def crear_personaje(personaje: PersonajeIn, db: Session = Depends(get_db)):
     """
     Crea un nuevo personaje en el sistema
 
     Args:
-        personaje (dict): Datos del personaje a crear. Debe contener:
-            - nombre (str): Nombre del personaje (requerido)
+        personaje (PersonajeIn): Datos del personaje a crear:
+            - nombre (str): Nombre del personaje (1 a 64 caracteres)
         db (Session): Sesión de base de datos (inyectada)
 
     Returns:
@@ -109,7 +151,8 @@ def crear_personaje(personaje: dict, db: Session = Depends(get_db)):
             - xp (int) - Inicializado en 0
 
     Raises:
-        HTTPException: 400 si falta el nombre o ya existe el personaje
+        HTTPException: 422 si falta el nombre o es inválido
+        HTTPException: 400 si ya existe el personaje
 
     Example:
         Request body:
@@ -123,24 +166,19 @@ def crear_personaje(personaje: dict, db: Session = Depends(get_db)):
         }
     """
     try:
-        # Validar datos del personaje
-        if not personaje.get("nombre"):
-            raise HTTPException(status_code=400, detail="El nombre es requerido")
-            
-        # Verificar si el personaje ya existe
-        existe = db.query(Personaje).filter(Personaje.nombre == personaje["nombre"]).first()
-        if existe:
-            raise HTTPException(status_code=400, detail="Ya existe un personaje con este nombre")
-            
-        nuevo_personaje = Personaje(nombre=personaje["nombre"], xp=0)
+        # La unicidad del nombre la garantiza el índice UNIQUE (sin SELECT previo)
+        nuevo_personaje = Personaje(nombre=personaje.nombre, xp=0)
         db.add(nuevo_personaje)
+        # expire_on_commit=False: los atributos siguen cargados tras el commit
         db.commit()
-        db.refresh(nuevo_personaje)
         return {
             "id": nuevo_personaje.id,
             "nombre": nuevo_personaje.nombre,
             "xp": nuevo_personaje.xp
         }
+    except IntegrityError:
+        db.rollback()
+        raise HTTPException(status_code=400, detail="Ya existe un personaje con este nombre")
     except Exception as e:
         db.rollback()
         raise HTTPException(
@@ -149,17 +187,14 @@ def crear_personaje(personaje: dict, db: Session = Depends(get_db)):
         )
 
 @app.post("/misiones")
-def crear_mision(
-    titulo: str = Query(..., min_length=3),
-    xp: int = Query(..., gt=0),
-    db: Session = Depends(get_db)
-):
+def crear_mision(mision: MisionIn, db: Session = Depends(get_db)):
     """
     Crea una nueva misión en el sistema
 
     Args:
-        titulo (str): Título de la misión (mínimo 3 caracteres)
-        xp (int): Experiencia (XP) que otorga la misión (mayor que 0)
+        mision (MisionIn): Datos de la misión a crear (cuerpo JSON):
+            - titulo (str): Título de la misión (mínimo 3 caracteres)
+            - xp (int): Experiencia (XP) que otorga la misión (mayor que 0)
         db (Session): Sesión de base de datos (inyectada)
 
     Returns:
@@ -170,11 +205,12 @@ def crear_mision(
             - mensaje (str)
 
     Raises:
-        HTTPException: 400 si el título ya existe o datos inválidos
+        HTTPException: 400 si el título ya existe
+        HTTPException: 422 si los datos son inválidos
 
     Example:
-        Request:
-        /misiones?titulo=Derrotar al jefe&xp=100
+        Request body:
+        {"titulo": "Derrotar al jefe", "xp": 100}
 
         Response:
         {
@@ -185,24 +221,23 @@ def crear_mision(
         }
     """
     try:
-        # Verificar si la misión ya existe
-        existe = db.query(Mision).filter(Mision.titulo == titulo).first()
-        if existe:
-            raise HTTPException(
-                status_code=400,
-                detail="Ya existe una misión con este título"
-            )
-            
-        mission = Mision(titulo=titulo, xp=xp)
+        # La unicidad del título la garantiza la restricción UNIQUE (sin SELECT previo)
+        mission = Mision(titulo=mision.titulo, xp=mision.xp)
         db.add(mission)
+        # expire_on_commit=False: los atributos siguen cargados tras el commit
         db.commit()
-        db.refresh(mission)
         return {
             "id": mission.id,
             "titulo": mission.titulo,
             "xp": mission.xp,
             "mensaje": "Misión creada exitosamente"
         }
+    except IntegrityError:
+        db.rollback()
+        raise HTTPException(
+            status_code=400,
+            detail="Ya existe una misión con este título"
+        )
     except Exception as e:
         db.rollback()
         raise HTTPException(
@@ -213,20 +248,44 @@ def crear_mision(
 @app.on_event("startup")
 def startup():
     Base.metadata.create_all(bind=engine)
+    # create_all omite tablas existentes: crear índices faltantes en bases antiguas
+    for tabla in Base.metadata.sorted_tables:
+        for indice in tabla.indexes:
+            indice.create(bind=engine, checkfirst=True)
+    # Precargar las colas FIFO de misiones pendientes en memoria
+    db = SessionLocal()
+    try:
+        cache_colas.precargar(db)
+    finally:
+        db.close()
+
+@app.on_event("startup")
+async def ajustar_threadpool():
+    """Limita los hilos de los endpoints síncronos al tamaño del pool
+
+    Cada endpoint `def` corre en el threadpool de AnyIO y toma una conexión;
+    con más hilos que conexiones los sobrantes solo esperarían al pool.
+    """
+    to_thread.current_default_thread_limiter().total_tokens = POOL_SIZE + MAX_OVERFLOW
 
 # [Previous endpoints remain unchanged...]
 
 @app.get("/personajes/{personaje_id}/misiones")
-def listar_misiones_personaje(personaje_id: int, db: Session = Depends(get_db)):
+def listar_misiones_personaje(
+    personaje_id: int,
+    if_none_match: Optional[str] = Header(None),
+    db: Session = Depends(get_db)
+):
     """
     Obtiene todas las misiones relacionadas con un personaje
 
     Args:
         personaje_id (int): ID del personaje
+        if_none_match (str|None): Cabecera If-None-Match con el ETag ya recibido
         db (Session): Sesión de base de datos (inyectada)
 
     Returns:
-        dict: Contiene:
+        dict: (304 sin cuerpo si el ETag coincide) Contiene:
             - personaje_id (int)
             - mision_activa (dict|None): Misión actual con:
                 * id (int)
@@ -263,15 +322,21 @@ def listar_misiones_personaje(personaje_id: int, db: Session = Depends(get_db)):
     try:
         logger.info(f"Obteniendo misiones para personaje {personaje_id}")
         
-        # Verificar que el personaje existe
-        personaje = db.query(Personaje).get(personaje_id)
+        # Cargar el personaje junto a sus misiones en una sola pasada:
+        # - joinedload para la misión activa (relación a uno)
+        # - selectinload para las colecciones (evita el producto cartesiano)
+        personaje = db.query(Personaje).options(
+            joinedload(Personaje.mision_activa),
+            selectinload(Personaje.misiones_pendientes),
+            selectinload(Personaje.misiones_completadas)
+        ).filter(Personaje.id == personaje_id).one_or_none()
         if not personaje:
             raise HTTPException(status_code=404, detail="Personaje no encontrado")
             
-        # Obtener misión activa si existe
+        # Obtener misión activa si existe (ya cargada con el personaje)
         mision_activa = None
         if personaje.mision_activa_id:
-            mision_activa = db.query(Mision).get(personaje.mision_activa_id)
+            mision_activa = personaje.mision_activa
             if not mision_activa:
                 logger.error(f"Misión activa {personaje.mision_activa_id} no encontrada")
                 raise HTTPException(
@@ -306,28 +371,17 @@ def listar_misiones_personaje(personaje_id: int, db: Session = Depends(get_db)):
         # Obtener todas las misiones disponibles (no asignadas ni completadas)
         misiones_disponibles = []
         try:
-            subquery_pendientes = db.query(personaje_misiones_pendientes.c.mision_id).filter(
-                personaje_misiones_pendientes.c.personaje_id == personaje_id
-            )
-            subquery_completadas = db.query(personaje_misiones_completadas.c.mision_id).filter(
-                personaje_misiones_completadas.c.personaje_id == personaje_id
-            )
-            
-            misiones_disponibles = db.query(Mision).filter(
-                Mision.id.notin_(subquery_pendientes),
-                Mision.id.notin_(subquery_completadas),
-                Mision.id != (personaje.mision_activa_id or 0)
-            ).all()
-            
             misiones_disponibles = [
                 {"id": m.id, "titulo": m.titulo, "xp": m.xp}
-                for m in misiones_disponibles
+                for m in db.execute(
+                    consulta_misiones_disponibles(personaje_id, personaje.mision_activa_id)
+                )
             ]
             logger.info(f"Encontradas {len(misiones_disponibles)} misiones disponibles")
         except Exception as e:
             logger.error(f"Error obteniendo misiones disponibles: {str(e)}")
         
-        return {
+        cuerpo = orjson.dumps({
             "personaje_id": personaje_id,
             "mision_activa": {
                 "id": mision_activa.id,
@@ -337,7 +391,14 @@ def listar_misiones_personaje(personaje_id: int, db: Session = Depends(get_db)):
             "misiones_pendientes": misiones_pendientes,
             "misiones_completadas": misiones_completadas,
             "misiones_disponibles": misiones_disponibles
-        }
+        })
+
+        # ETag del contenido: si el cliente ya tiene esta versión, 304 sin cuerpo
+        etag = f'"{hashlib.blake2b(cuerpo, digest_size=16).hexdigest()}"'
+        cabeceras = {"ETag": etag, "Cache-Control": "max-age=0"}
+        if if_none_match == etag:
+            return Response(status_code=304, headers=cabeceras)
+        return Response(content=cuerpo, media_type="application/json", headers=cabeceras)
     except HTTPException:
         raise
     except Exception as e:
@@ -350,27 +411,12 @@ def listar_misiones_personaje(personaje_id: int, db: Session = Depends(get_db)):
 def listar_misiones_disponibles(personaje_id: int, db: Session = Depends(get_db)):
     try:
         # Verificar que el personaje existe
-        personaje = db.query(Personaje).get(personaje_id)
+        personaje = db.get(Personaje, personaje_id, options=[load_only(Personaje.mision_activa_id)])
         if not personaje:
             raise HTTPException(status_code=404, detail="Personaje no encontrado")
             
-        # Obtener IDs de misiones ya asignadas o completadas
-        misiones_pendientes = db.query(
-            personaje_misiones_pendientes.c.mision_id
-        ).filter(
-            personaje_misiones_pendientes.c.personaje_id == personaje_id
-        )
-        
-        misiones_completadas = db.query(
-            personaje_misiones_completadas.c.mision_id
-        ).filter(
-            personaje_misiones_completadas.c.personaje_id == personaje_id
-        )
-        
-        misiones = db.query(Mision).filter(
-            ~Mision.id.in_(misiones_pendientes),
-            ~Mision.id.in_(misiones_completadas),
-            Mision.id != personaje.mision_activa_id if personaje.mision_activa_id else True
+        misiones = db.execute(
+            consulta_misiones_disponibles(personaje_id, personaje.mision_activa_id)
         ).all()
         
         return [
@@ -384,6 +430,99 @@ def listar_misiones_disponibles(personaje_id: int, db: Session = Depends(get_db)
             detail=f"Error obteniendo misiones disponibles: {str(e)}"
         )
 
+@app.post("/personajes/{personaje_id}/misiones/batch")
+def asignar_misiones_batch(
+    personaje_id: int,
+    mision_ids: List[int],
+    db: Session = Depends(get_db)
+):
+    """
+    Asigna varias misiones a un personaje en una sola transacción (FIFO)
+
+    Equivale a llamar a asignar_mision por cada ID en el orden recibido:
+    - Si el personaje no tiene misión activa, la primera pasa a ser activa
+    - El resto se añade a la cola con un único executemany
+
+    Nota: se declara antes de /misiones/{mision_id} para que "batch"
+    no se interprete como un ID de misión.
+
+    Args:
+        personaje_id (int): ID del personaje
+        mision_ids (List[int]): IDs de las misiones (cuerpo JSON)
+        db (Session): Sesión de base de datos (inyectada)
+
+    Returns:
+        dict: Contiene:
+            - mensaje (str)
+            - mision_activa (int|None): ID de la misión activa
+            - en_cola (int): Cantidad de misiones añadidas a la cola
+
+    Raises:
+        HTTPException: 404 si no existe el personaje o alguna misión
+        HTTPException: 400 si hay error en la asignación
+
+    Example:
+        Request body:
+        [5, 6, 7]
+
+        Response exitosa:
+        {
+            "mensaje": "Misiones asignadas correctamente",
+            "mision_activa": 5,
+            "en_cola": 2
+        }
+    """
+    try:
+        # Todas las lecturas van dentro del lock: la misión activa leída
+        # antes podría cambiar por otra petición sobre el mismo personaje
+        with cache_colas.bloquear(personaje_id):
+            personaje = db.get(Personaje, personaje_id, options=[load_only(Personaje.mision_activa_id)])
+            if not personaje:
+                raise HTTPException(status_code=404, detail="Personaje no encontrado")
+
+            existentes = set(db.scalars(select(Mision.id).where(Mision.id.in_(mision_ids))))
+            faltantes = [mid for mid in mision_ids if mid not in existentes]
+            if faltantes:
+                raise HTTPException(status_code=404, detail=f"Misiones no encontradas: {faltantes}")
+
+            pendientes = list(mision_ids)
+            if pendientes and not personaje.mision_activa_id:
+                personaje.mision_activa_id = pendientes.pop(0)
+
+            if pendientes:
+                base = db.execute(
+                    text("SELECT COALESCE(MAX(orden), 0) FROM personaje_misiones_pendientes "
+                         "WHERE personaje_id = :pid"),
+                    {"pid": personaje_id}
+                ).scalar()
+                # Una sola sentencia preparada para todas las filas (cursor.executemany)
+                db.execute(
+                    personaje_misiones_pendientes.insert(),
+                    [
+                        {"personaje_id": personaje_id, "mision_id": mid, "orden": base + i + 1}
+                        for i, mid in enumerate(pendientes)
+                    ]
+                )
+
+            db.commit()
+            for mid in pendientes:
+                cache_colas.encolar(personaje_id, mid)
+
+        return {
+            "mensaje": "Misiones asignadas correctamente",
+            "mision_activa": personaje.mision_activa_id,
+            "en_cola": len(pendientes)
+        }
+    except HTTPException:
+        db.rollback()
+        raise
+    except Exception as e:
+        db.rollback()
+        raise HTTPException(
+            status_code=400,
+            detail=f"Error asignando misiones: {str(e)}"
+        )
+
 @app.post("/personajes/{personaje_id}/misiones/{mision_id}")
 def asignar_mision(
     personaje_id: int, 
@@ -422,34 +561,35 @@ def asignar_mision(
         }
     """
     try:
-        # Verificar que existan el personaje y la misión
-        personaje = db.query(Personaje).get(personaje_id)
-        if not personaje:
-            raise HTTPException(status_code=404, detail="Personaje no encontrado")
-            
-        mision = db.query(Mision).get(mision_id)
-        if not mision:
-            raise HTTPException(status_code=404, detail="Misión no encontrada")
-        
-        # Si no tiene misión activa, asignarla directamente
-        if not personaje.mision_activa_id:
-            personaje.mision_activa_id = mision_id
-        else:
-            # Si ya tiene misión activa, agregar a la cola
-            max_orden = db.execute(
-                text("SELECT MAX(orden) FROM personaje_misiones_pendientes "
-                     "WHERE personaje_id = :pid"),
-                {"pid": personaje_id}
-            ).scalar() or 0
-            
-            db.execute(
-                text("INSERT INTO personaje_misiones_pendientes "
-                     "(personaje_id, mision_id, orden) "
-                     "VALUES (:pid, :mid, :ord)"),
-                {"pid": personaje_id, "mid": mision_id, "ord": max_orden + 1}
-            )
-        
-        db.commit()
+        # Las lecturas van dentro del lock para decidir con la misión activa vigente
+        with cache_colas.bloquear(personaje_id):
+            # Verificar que existan el personaje y la misión
+            personaje = db.get(Personaje, personaje_id, options=[load_only(Personaje.mision_activa_id)])
+            if not personaje:
+                raise HTTPException(status_code=404, detail="Personaje no encontrado")
+
+            mision = db.get(Mision, mision_id, options=[load_only(Mision.id)])
+            if not mision:
+                raise HTTPException(status_code=404, detail="Misión no encontrada")
+
+            # Si no tiene misión activa, asignarla directamente
+            if not personaje.mision_activa_id:
+                personaje.mision_activa_id = mision_id
+                db.commit()
+            else:
+                # Si ya tiene misión activa, agregar al final de la cola
+                # (cálculo del orden e inserción en una sola sentencia atómica)
+                db.execute(
+                    text("INSERT INTO personaje_misiones_pendientes "
+                         "(personaje_id, mision_id, orden) "
+                         "SELECT :pid, :mid, COALESCE(MAX(orden), 0) + 1 "
+                         "FROM personaje_misiones_pendientes "
+                         "WHERE personaje_id = :pid"),
+                    {"pid": personaje_id, "mid": mision_id}
+                )
+                db.commit()
+                cache_colas.encolar(personaje_id, mision_id)
+
         return {
             "mensaje": "Misión asignada correctamente",
             "mision_activa": personaje.mision_activa_id == mision_id,
@@ -471,8 +611,7 @@ def completar_mision(personaje_id: int, db: Session = Depends(get_db)):
     1. Verifica que el personaje tenga misión activa
     2. Añade la XP de la misión al personaje
     3. Mueve la misión a completadas
-    4. Asigna la siguiente misión de la cola (si existe)
-    5. Elimina la misión asignada de la cola
+    4. Extrae la siguiente misión de la cola y la asigna (si existe)
 
     Args:
         personaje_id (int): ID del personaje
@@ -498,47 +637,44 @@ def completar_mision(personaje_id: int, db: Session = Depends(get_db)):
         }
     """
     try:
-        personaje = db.query(Personaje).get(personaje_id)
-        if not personaje:
-            raise HTTPException(status_code=404, detail="Personaje no encontrado")
-            
-        if not personaje.mision_activa_id:
-            raise HTTPException(status_code=400, detail="El personaje no tiene misión activa")
+        # Las lecturas van dentro del lock para completar la misión activa vigente
+        with cache_colas.bloquear(personaje_id):
+            personaje = db.get(Personaje, personaje_id, options=[load_only(Personaje.xp, Personaje.mision_activa_id)])
+            if not personaje:
+                raise HTTPException(status_code=404, detail="Personaje no encontrado")
+
+            if not personaje.mision_activa_id:
+                raise HTTPException(status_code=400, detail="El personaje no tiene misión activa")
+
+            mision = db.get(Mision, personaje.mision_activa_id, options=[load_only(Mision.xp)])
+            if not mision:
+                raise HTTPException(status_code=404, detail="Misión activa no encontrada")
+
+            # Siguiente misión desde la cola FIFO en memoria (sin SELECT)
+            siguiente_mision = cache_colas.obtener(db, personaje_id).first()
+            if siguiente_mision is not None:
+                db.execute(
+                    text("DELETE FROM personaje_misiones_pendientes "
+                         "WHERE personaje_id = :pid AND mision_id = :mid"),
+                    {"pid": personaje_id, "mid": siguiente_mision}
+                )
             
-        mision = db.query(Mision).get(personaje.mision_activa_id)
-        if not mision:
-            raise HTTPException(status_code=404, detail="Misión activa no encontrada")
+            # Calcular XP ganada
+            xp_ganada = mision.xp
+            personaje.xp += xp_ganada
             
-        # Obtener siguiente misión de la cola FIFO
-        siguiente_mision = db.execute(
-            text("SELECT mision_id FROM personaje_misiones_pendientes "
-                 "WHERE personaje_id = :pid ORDER BY orden ASC LIMIT 1"),
-            {"pid": personaje_id}
-        ).fetchone()
-        
-        # Calcular XP ganada
-        xp_ganada = mision.xp
-        personaje.xp += xp_ganada
-        
-        # Mover misión actual a completadas
-        db.execute(
-            text("INSERT INTO personaje_misiones_completadas "
-                 "(personaje_id, mision_id) VALUES (:pid, :mid)"),
-            {"pid": personaje_id, "mid": personaje.mision_activa_id}
-        )
-        
-        # Asignar siguiente misión o limpiar
-        if siguiente_mision:
-            personaje.mision_activa_id = siguiente_mision[0]
+            # Mover misión actual a completadas
             db.execute(
-                text("DELETE FROM personaje_misiones_pendientes "
-                     "WHERE personaje_id = :pid AND mision_id = :mid"),
-                {"pid": personaje_id, "mid": siguiente_mision[0]}
+                text("INSERT INTO personaje_misiones_completadas "
+                     "(personaje_id, mision_id) VALUES (:pid, :mid)"),
+                {"pid": personaje_id, "mid": personaje.mision_activa_id}
             )
-        else:
-            personaje.mision_activa_id = None
             
-        db.commit()
+            # Asignar siguiente misión o limpiar
+            personaje.mision_activa_id = siguiente_mision
+                
+            db.commit()
+            cache_colas.desencolar(personaje_id)
         
         return {
             "mensaje": "Misión completada exitosamente",
@@ -13,6 +13,7 @@ class ColaMisiones:
     
     Atributos:
         items: deque que almacena IDs de misiones en orden FIFO
+            (con maxlen opcional: al llenarse descarta la más antigua)
     
     Ejemplo:
         >>> cola = ColaMisiones()
@@ -21,8 +22,8 @@ class ColaMisiones:
         >>> cola.dequeue()
         101
     """
-    def __init__(self):
-        self.items = deque()
+    def __init__(self, maxlen=None):
+        self.items = deque(maxlen=maxlen)
 
     def enqueue(self, mission_id: int):
         """Añade una misión al final de la cola
@@ -39,9 +40,7 @@ class ColaMisiones:
             int: ID de la misión removida
             None: Si la cola está vacía
         """
-        if not self.is_empty():
-            return self.items.popleft()
-        return None
+        return self.items.popleft() if self.items else None
 
     def first(self):
         """Consulta la próxima misión sin removerla
@@ -50,7 +49,7 @@ class ColaMisiones:
             int: ID de la próxima misión
             None: Si la cola está vacía
         """
-        return self.items[0] if not self.is_empty() else None
+        return self.items[0] if self.items else None
 
     def is_empty(self):
         """Verifica si la cola está vacía
@@ -58,7 +57,7 @@ class ColaMisiones:
         Returns:
             bool: True si vacía, False si tiene misiones
         """
-        return len(self.items) == 0
+        return not self.items
 
     def size(self):
         """Cantidad de misiones en cola
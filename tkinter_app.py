@@ -8,17 +8,262 @@ Contiene:
 - Conexión con API REST para operaciones CRUD
 """
 
+import atexit
+import queue
+from operator import itemgetter
+from concurrent.futures import ThreadPoolExecutor
 import tkinter as tk
 from tkinter import ttk, messagebox
+from tkinter import font as tkfont
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
 
 BASE_URL = "http://127.0.0.1:8000"
+INTERVALO_BOMBEO_MS = 20  # Frecuencia con la que Tk recoge resultados de red
+DEBOUNCE_REFRESH_MS = 100  # Ventana para agrupar recargas de misiones
+TIMEOUT = (1.0, 5.0)  # Segundos (conexión, lectura) para toda petición HTTP
+DURACION_ESTADO_MS = 3000  # Tiempo visible de los mensajes de la barra de estado
+
+# Formato de filas: plantilla % ya enlazada + itemgetter (ambos en C),
+# aplicados con map en lugar de un f-string por iteración
+_FMT_PERSONAJE = "ID: %d - %s (XP: %d)".__mod__
+_GET_PERSONAJE = itemgetter('id', 'nombre', 'xp')
+_FMT_MISION = "%d: %s (XP: %d)".__mod__
+_GET_MISION = itemgetter('id', 'titulo', 'xp')
+_FMT_DISPONIBLE = "%d: %s".__mod__
+_GET_DISPONIBLE = itemgetter('id', 'titulo')
+_GET_ID = itemgetter('id')
+
+def _preparar_personajes(personajes):
+    """Convierte la respuesta de /personajes en datos listos para la interfaz
+
+    Se ejecuta en el pool de hilos, junto al GET y la decodificación JSON,
+    para que el hilo de Tk solo inserte filas ya formateadas.
+
+    Returns:
+        dict: ids y nombres (listas paralelas) y filas del Listbox
+    """
+    filas = list(map(_GET_PERSONAJE, personajes))
+    return {
+        'ids': [i for i, _, _ in filas],
+        'nombres': [n for _, n, _ in filas],
+        'filas': list(map(_FMT_PERSONAJE, filas)),
+    }
+
+def _preparar_misiones(data):
+    """Convierte la respuesta de /personajes/{id}/misiones en datos para la interfaz
+
+    Se ejecuta en el pool de hilos (ver _preparar_personajes).
+
+    Returns:
+        dict: IDs y filas de pendientes e historial, valores del combobox
+            y texto de la misión activa
+    """
+    pendientes = data.get('misiones_pendientes', ())
+    completadas = data.get('misiones_completadas', ())
+    mision_activa = data.get('mision_activa')
+    return {
+        'pendientes_ids': list(map(_GET_ID, pendientes)),
+        'pendientes_filas': list(map(_FMT_MISION, map(_GET_MISION, pendientes))),
+        'historial_ids': list(map(_GET_ID, completadas)),
+        'historial_filas': list(map(_FMT_MISION, map(_GET_MISION, completadas))),
+        'disponibles': list(map(
+            _FMT_DISPONIBLE,
+            map(_GET_DISPONIBLE, data.get('misiones_disponibles', ()))
+        )),
+        'mision_activa': (
+            f"{mision_activa['titulo']} (XP: {mision_activa['xp']})"
+            if mision_activa else "Ninguna misión activa"
+        ),
+    }
+
+def _rellenar_listbox(listbox, items):
+    """Reemplaza el contenido de un Listbox con una sola inserción
+
+    Listbox.insert acepta varios elementos: se hace una única llamada a Tcl
+    en lugar de una por fila, y un solo repintado al final.
+
+    Args:
+        listbox: tk.Listbox a rellenar
+        items: Lista de textos ya formateados
+    """
+    listbox.delete(0, tk.END)
+    if items:
+        listbox.insert(tk.END, *items)
+    listbox.update_idletasks()
+
+def _actualizar_listbox(listbox, ids_previos, ids_nuevos, items):
+    """Aplica a un Listbox solo las filas que cambiaron respecto al refresco anterior
+
+    Conserva el prefijo y el sufijo comunes (p. ej. misiones añadidas al final
+    del historial o sacadas del frente de la cola) y reemplaza solo el tramo
+    intermedio.
+
+    Args:
+        listbox: tk.Listbox mostrado actualmente con ids_previos
+        ids_previos: IDs de las filas actuales del Listbox
+        ids_nuevos: IDs de las filas a mostrar
+        items: Textos ya formateados, alineados con ids_nuevos
+
+    Returns:
+        list: ids_nuevos, para usar como ids_previos en el siguiente refresco
+    """
+    if ids_nuevos == ids_previos:
+        return ids_previos
+
+    limite = min(len(ids_previos), len(ids_nuevos))
+    prefijo = 0
+    while prefijo < limite and ids_previos[prefijo] == ids_nuevos[prefijo]:
+        prefijo += 1
+    sufijo = 0
+    while (sufijo < limite - prefijo
+           and ids_previos[-1 - sufijo] == ids_nuevos[-1 - sufijo]):
+        sufijo += 1
+
+    fin_previo = len(ids_previos) - sufijo
+    if fin_previo > prefijo:
+        listbox.delete(prefijo, fin_previo - 1)
+    tramo = items[prefijo:len(ids_nuevos) - sufijo]
+    if tramo:
+        listbox.insert(prefijo, *tramo)
+    return ids_nuevos
+
+class VirtualListbox(tk.Listbox):
+    """Listbox que solo inserta en el widget las filas visibles
+
+    El contenido completo vive en una lista de Python (_data) y al
+    desplazarse se redibuja únicamente la ventana visible, de modo que el
+    costo de refresco no crece con la longitud del historial.
+
+    Atributos:
+        _data: Textos de todas las filas
+        _top: Índice de la primera fila visible
+        _filas: Cantidad de filas que caben en el widget
+    """
+    def __init__(self, master=None, **kw):
+        super().__init__(master, **kw)
+        self._data = []
+        self._top = 0
+        self._filas = int(self.cget('height'))
+        self._scroll_command = None
+        self.bind('<Configure>', self._al_redimensionar)
+        self.bind('<MouseWheel>', self._al_rueda)
+        self.bind('<Button-4>', lambda e: self._desplazar(-1))
+        self.bind('<Button-5>', lambda e: self._desplazar(1))
+
+    def conectar_scrollbar(self, scrollbar):
+        """Vincula una scrollbar vertical al desplazamiento virtual"""
+        self._scroll_command = scrollbar.set
+        scrollbar.config(command=self.yview)
+
+    def set_data(self, items):
+        """Reemplaza todas las filas y redibuja la ventana visible
+
+        Args:
+            items: Lista de textos ya formateados
+        """
+        self._data = list(items)
+        self._render_window()
+
+    def yview(self, *args):
+        """Atiende los comandos de la scrollbar ('moveto' / 'scroll')"""
+        total = len(self._data)
+        if not args:
+            return self._fracciones()
+        if args[0] == 'moveto':
+            self._top = int(float(args[1]) * total)
+        elif args[0] == 'scroll':
+            paso = int(args[1])
+            if args[2] == 'pages':
+                paso *= self._filas
+            self._top += paso
+        self._render_window()
+
+    def _fracciones(self):
+        total = len(self._data)
+        if not total:
+            return 0.0, 1.0
+        return self._top / total, min(1.0, (self._top + self._filas) / total)
+
+    def _desplazar(self, filas):
+        self.yview('scroll', filas, 'units')
+        return 'break'
+
+    def _al_rueda(self, event):
+        return self._desplazar(-1 if event.delta > 0 else 1)
+
+    def _al_redimensionar(self, event):
+        alto_linea = tkfont.Font(font=self.cget('font')).metrics('linespace') + 1
+        filas = max(1, event.height // alto_linea)
+        if filas != self._filas:
+            self._filas = filas
+            self._render_window()
+
+    def _render_window(self):
+        self._top = max(0, min(self._top, len(self._data) - self._filas))
+        _rellenar_listbox(self, self._data[self._top:self._top + self._filas])
+        if self._scroll_command:
+            self._scroll_command(*self._fracciones())
 
 class RPGApp:
     def __init__(self, root):
         self.root = root
         self.root.title("Sistema de Misiones RPG")
+
+        # Sesión HTTP reutilizada (keep-alive): evita abrir una conexión TCP por petición
+        self.http = requests.Session()
+        self.http.headers.update({"Content-Type": "application/json"})
+        # Reintentos solo en métodos idempotentes: repetir un POST podría,
+        # por ejemplo, completar dos misiones
+        reintentos = Retry(
+            total=2,
+            backoff_factor=0.1,
+            status_forcelist=[502, 503, 504],
+            allowed_methods=frozenset(["GET", "DELETE"])
+        )
+        self.http.mount("http://", HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=reintentos))
+        atexit.register(self.http.close)
+        
+        self.selected_char_id = None
+        self.selected_char_name = None
+
+        # Datos de char_listbox en listas paralelas indexadas por fila
+        self._char_ids = []
+        self._char_names = []
+
+        # IDs mostrados en las listas de misiones (para refrescos incrementales)
+        self._last_pending_ids = []
+        self._last_history_ids = []
+        # Último estado escrito en combobox/etiqueta (evita reescrituras en Tcl)
+        self._last_combo_values = None
+        self._last_mission_text = None
+        # Personaje y ETag de las misiones mostradas (GET condicional)
+        self._personaje_mostrado = None
+        self._etag_mostrado = None
+        # Número de secuencia de cada GET y del último aplicado: las respuestas
+        # llegan en el orden en que terminan y las más viejas se descartan
+        self._seq_personajes = 0
+        self._seq_personajes_aplicada = 0
+        self._seq_misiones = 0
+        self._seq_misiones_aplicada = 0
+
+        # Peticiones HTTP en un pool de hilos; sus resultados se consumen
+        # en el hilo de Tk por _bombear_resultados
+        self.pool = ThreadPoolExecutor(max_workers=4)
+        atexit.register(self.pool.shutdown, wait=False)
+        self._resultados = queue.Queue()
+        self.root.after(INTERVALO_BOMBEO_MS, self._bombear_resultados)
+
+        # ID del root.after pendiente que agrupa recargas de misiones
+        self._refresh_pending = None
         
+        # Barra de estado no modal para confirmaciones (los errores siguen siendo diálogos)
+        self.status = ttk.Label(root, relief='sunken', anchor='w')
+        self.status.pack(side='bottom', fill='x')
+        self._status_pending = None
+
         self.notebook = ttk.Notebook(root)
         self.notebook.pack(padx=10, pady=10, fill='both', expand=True)
 
@@ -28,16 +273,8 @@ class RPGApp:
         self.list_frame = ttk.Frame(self.tab_personajes)
         self.list_frame.pack(fill='both', expand=True, padx=5, pady=5)
 
-        self.char_listbox = tk.Listbox(self.list_frame)
-        self.char_listbox.pack(side='left', fill='both', expand=True)
+        self.char_listbox = self._crear_listbox_con_scroll(self.list_frame)
         self.char_listbox.bind('<<ListboxSelect>>', self.on_character_select)
-        
-        self.selected_char_id = None
-        self.selected_char_name = None
-        
-        scrollbar = ttk.Scrollbar(self.list_frame, orient='vertical', command=self.char_listbox.yview)
-        scrollbar.pack(side='right', fill='y')
-        self.char_listbox.config(yscrollcommand=scrollbar.set)
 
         self.buttons_frame = ttk.Frame(self.tab_personajes)
         self.buttons_frame.pack(fill='x', pady=5)
@@ -54,9 +291,19 @@ class RPGApp:
         self.nombre_entry.grid(row=0, column=1, padx=5, pady=5)
         ttk.Button(self.creation_frame, text="Crear Personaje", command=self.crear_personaje).grid(row=0, column=2, padx=5, pady=5)
 
+        # El contenido de la pestaña de misiones se construye al abrirla por primera vez
         self.tab_misiones = ttk.Frame(self.notebook)
         self.notebook.add(self.tab_misiones, text="Misiones")
-        
+        self._tab_misiones_construida = False
+        self.notebook.bind('<<NotebookTabChanged>>', self._al_cambiar_tab)
+
+        # Cargar personajes después del primer repintado de la ventana
+        self.root.after_idle(self.actualizar_personajes)
+
+    def _construir_tab_misiones(self):
+        """Crea los widgets de la pestaña de misiones (una sola vez)"""
+        self._tab_misiones_construida = True
+
         self.current_mission_frame = ttk.LabelFrame(self.tab_misiones, text="Misión Actual")
         self.current_mission_frame.pack(fill='x', padx=10, pady=5)
         
@@ -68,12 +315,7 @@ class RPGApp:
         self.queue_frame = ttk.LabelFrame(self.tab_misiones, text="Misiones en Cola (FIFO)")
         self.queue_frame.pack(fill='both', expand=True, padx=10, pady=5)
         
-        self.queue_listbox = tk.Listbox(self.queue_frame)
-        self.queue_listbox.pack(side='left', fill='both', expand=True)
-        
-        scrollbar = ttk.Scrollbar(self.queue_frame, orient='vertical', command=self.queue_listbox.yview)
-        scrollbar.pack(side='right', fill='y')
-        self.queue_listbox.config(yscrollcommand=scrollbar.set)
+        self.queue_listbox = self._crear_listbox_con_scroll(self.queue_frame)
         
         self.controls_frame = ttk.Frame(self.tab_misiones)
         self.controls_frame.pack(fill='x', padx=10, pady=5)
@@ -104,14 +346,85 @@ class RPGApp:
         self.history_frame = ttk.LabelFrame(self.tab_misiones, text="Misiones Completadas")
         self.history_frame.pack(fill='both', expand=True, padx=10, pady=5)
         
-        self.history_listbox = tk.Listbox(self.history_frame)
-        self.history_listbox.pack(side='left', fill='both', expand=True)
-        
-        scrollbar = ttk.Scrollbar(self.history_frame, orient='vertical', command=self.history_listbox.yview)
+        # El historial crece sin límite: solo se dibujan las filas visibles
+        self.history_listbox = self._crear_listbox_con_scroll(self.history_frame, VirtualListbox)
+
+    def _al_cambiar_tab(self, event):
+        if not self._tab_misiones_construida and self.notebook.index('current') == 1:
+            self._construir_tab_misiones()
+
+    def _crear_listbox_con_scroll(self, parent, clase=tk.Listbox):
+        """Crea un Listbox con su scrollbar vertical dentro de parent
+
+        Args:
+            parent: Frame contenedor
+            clase: tk.Listbox o VirtualListbox
+
+        Returns:
+            El listbox creado
+        """
+        listbox = clase(parent)
+        listbox.pack(side='left', fill='both', expand=True)
+        scrollbar = ttk.Scrollbar(parent, orient='vertical')
         scrollbar.pack(side='right', fill='y')
-        self.history_listbox.config(yscrollcommand=scrollbar.set)
+        if isinstance(listbox, VirtualListbox):
+            listbox.conectar_scrollbar(scrollbar)
+        else:
+            scrollbar.config(command=listbox.yview)
+            listbox.config(yscrollcommand=scrollbar.set)
+        return listbox
+
+    def _en_segundo_plano(self, trabajo, al_terminar, mensaje_error):
+        """Ejecuta una petición bloqueante en el pool, fuera del hilo de Tk
+
+        Peticiones independientes enviadas seguidas corren en paralelo.
+
+        Args:
+            trabajo: Función sin argumentos que hace la petición HTTP
+            al_terminar: Callback que recibe el resultado en el hilo de Tk
+            mensaje_error: Prefijo del mensaje mostrado si trabajo falla
+        """
+        def entregar(futuro):
+            try:
+                self._resultados.put((al_terminar, futuro.result()))
+            except requests.exceptions.Timeout:
+                self._resultados.put((self._mostrar_error, f"{mensaje_error}: Servidor no responde"))
+            except Exception as e:
+                self._resultados.put((self._mostrar_error, f"{mensaje_error}: {str(e)}"))
+
+        self.pool.submit(trabajo).add_done_callback(entregar)
+
+    def _bombear_resultados(self):
+        """Entrega en el hilo de Tk los resultados de las peticiones de fondo
+
+        Se reprograma con root.after para que la interfaz siga repintándose
+        mientras las peticiones están en curso.
+        """
+        try:
+            while True:
+                callback, valor = self._resultados.get_nowait()
+                callback(valor)
+        except queue.Empty:
+            pass
+        finally:
+            self.root.after(INTERVALO_BOMBEO_MS, self._bombear_resultados)
+
+    def _mostrar_error(self, mensaje):
+        messagebox.showerror("Error", mensaje)
+
+    def _flash(self, mensaje):
+        """Muestra un mensaje en la barra de estado durante DURACION_ESTADO_MS
 
-        self.actualizar_personajes()
+        A diferencia de messagebox.showinfo no abre un bucle modal.
+        """
+        if self._status_pending:
+            self.root.after_cancel(self._status_pending)
+        self.status.config(text=mensaje)
+        self._status_pending = self.root.after(DURACION_ESTADO_MS, self._limpiar_estado)
+
+    def _limpiar_estado(self):
+        self._status_pending = None
+        self.status.config(text='')
 
     def on_character_select(self, event):
         """Manejador de evento para selección de personaje en la lista
@@ -122,56 +435,69 @@ class RPGApp:
         Actualiza:
             selected_char_id: ID del personaje seleccionado
             selected_char_name: Nombre del personaje seleccionado
+            Misiones del personaje (precarga en segundo plano)
         """
         selection = self.char_listbox.curselection()
         if selection:
-            selected_text = self.char_listbox.get(selection[0])
-            parts = selected_text.split()
-            self.selected_char_id = int(parts[1])
-            self.selected_char_name = ' '.join(parts[3:-1]).strip('()')
+            i = selection[0]
+            self.selected_char_id = self._char_ids[i]
+            self.selected_char_name = self._char_names[i]
+            # Precargar sus misiones para que la pestaña se abra ya rellena
+            self._programar_actualizacion()
 
     def seleccionar_personaje(self):
         """Selecciona el personaje actual para operaciones de misiones
         
         Valida que haya un personaje seleccionado.
         Cambia a la pestaña de misiones.
-        Muestra mensaje de confirmación.
+        Muestra confirmación en la barra de estado.
         """
         if not self.selected_char_id:
             messagebox.showerror("Error", "Selecciona un personaje primero")
             return
             
         self.notebook.select(1)
-        messagebox.showinfo("Personaje seleccionado", f"Personaje {self.selected_char_name} (ID: {self.selected_char_id}) seleccionado")
+        self._flash(f"Personaje {self.selected_char_name} (ID: {self.selected_char_id}) seleccionado")
 
     def actualizar_personajes(self):
-        try:
-            res = requests.get(f"{BASE_URL}/personajes", timeout=5)
+        self._seq_personajes += 1
+        seq = self._seq_personajes
+
+        def obtener():
+            res = self.http.get(f"{BASE_URL}/personajes", timeout=TIMEOUT)
             res.raise_for_status()
-            
-            personajes = res.json()
-            self.char_listbox.delete(0, tk.END)
-            
-            for p in personajes:
-                self.char_listbox.insert(tk.END, f"ID: {p['id']} - {p['nombre']} (XP: {p['xp']})")
-                
-        except Exception as e:
-            messagebox.showerror("Error", f"Error al obtener personajes: {str(e)}")
+            return _preparar_personajes(orjson.loads(res.content))
+
+        self._en_segundo_plano(
+            obtener,
+            lambda vista: self._mostrar_personajes(vista, seq),
+            "Error al obtener personajes"
+        )
+
+    def _mostrar_personajes(self, vista, seq):
+        if seq < self._seq_personajes_aplicada:  # llegó después de una más nueva
+            return
+        self._seq_personajes_aplicada = seq
+        self._char_ids = vista['ids']
+        self._char_names = vista['nombres']
+        _rellenar_listbox(self.char_listbox, vista['filas'])
 
     def crear_personaje(self):
-        nombre = self.nombre_entry.get()
+        nombre = self.nombre_entry.get().strip()
         if nombre:
-            try:
-                res = requests.post(
+            def crear():
+                res = self.http.post(
                     f"{BASE_URL}/personajes",
-                    json={"nombre": nombre},
-                    headers={"Content-Type": "application/json"}
+                    data=orjson.dumps({"nombre": nombre}),
+                    timeout=TIMEOUT
                 )
                 res.raise_for_status()
-                messagebox.showinfo("Éxito", f"Personaje {nombre} creado")
+
+            def al_crear(_):
+                self._flash(f"Personaje {nombre} creado")
                 self.actualizar_personajes()
-            except Exception as e:
-                messagebox.showerror("Error", f"No se pudo crear el personaje: {str(e)}")
+
+            self._en_segundo_plano(crear, al_crear, "No se pudo crear el personaje")
 
     def eliminar_personaje(self):
         """Elimina el personaje seleccionado
@@ -185,68 +511,129 @@ class RPGApp:
             messagebox.showerror("Error", "Selecciona un personaje primero")
             return
             
-        personaje_id = int(self.char_listbox.get(selection[0]).split()[1])
+        personaje_id = self._char_ids[selection[0]]
         
-        try:
-            response = requests.delete(f"{BASE_URL}/personajes/{personaje_id}")
+        def al_eliminar(response):
             if response.status_code == 200:
-                messagebox.showinfo("Éxito", "Personaje eliminado")
+                self._flash("Personaje eliminado")
                 self.actualizar_personajes()
             else:
                 messagebox.showerror("Error", f"No se pudo eliminar: {response.text}")
-        except Exception as e:
-            messagebox.showerror("Error", f"Error al eliminar: {str(e)}")
+
+        self._en_segundo_plano(
+            lambda: self.http.delete(f"{BASE_URL}/personajes/{personaje_id}", timeout=TIMEOUT),
+            al_eliminar,
+            "Error al eliminar"
+        )
 
     def actualizar_misiones(self):
         if not self.selected_char_id:
             return
 
-        try:
-            res = requests.get(f"{BASE_URL}/personajes/{self.selected_char_id}/misiones")
-            data = res.json()
+        personaje_id = self.selected_char_id
+        self._seq_misiones += 1
+        seq = self._seq_misiones
+        # Solo se revalida con If-None-Match si se muestra este mismo personaje
+        cabeceras = {}
+        if personaje_id == self._personaje_mostrado and self._etag_mostrado:
+            cabeceras['If-None-Match'] = self._etag_mostrado
+
+        def obtener():
+            res = self.http.get(
+                f"{BASE_URL}/personajes/{personaje_id}/misiones",
+                headers=cabeceras,
+                timeout=TIMEOUT
+            )
+            if res.status_code == 304:
+                return None
+            vista = _preparar_misiones(orjson.loads(res.content))
+            vista['etag'] = res.headers.get('ETag')
+            return vista
+
+        self._en_segundo_plano(
+            obtener,
+            lambda vista: self._mostrar_misiones(vista, personaje_id, seq),
+            "Error al actualizar misiones"
+        )
+
+    def _programar_actualizacion(self):
+        """Agrupa recargas de misiones pedidas en menos de DEBOUNCE_REFRESH_MS
+
+        Varias operaciones seguidas (clics rápidos) provocan un solo GET.
+        """
+        if self._refresh_pending:
+            return
+        self._refresh_pending = self.root.after(DEBOUNCE_REFRESH_MS, self._ejecutar_actualizacion)
+
+    def _ejecutar_actualizacion(self):
+        self._refresh_pending = None
+        self.actualizar_misiones()
 
-            self.queue_listbox.delete(0, tk.END)
-            for m in data.get('misiones_pendientes', []):
-                self.queue_listbox.insert(tk.END, f"{m['id']}: {m['titulo']} (XP: {m['xp']})")
+    def _mostrar_misiones(self, vista, personaje_id, seq):
+        # Descartar respuestas de otro personaje (la selección cambió en
+        # vuelo) o anteriores a la última aplicada
+        if personaje_id != self.selected_char_id or seq < self._seq_misiones_aplicada:
+            return
+        self._seq_misiones_aplicada = seq
+        if vista is None:  # 304: lo mostrado sigue vigente
+            return
+        if not self._tab_misiones_construida:
+            self._construir_tab_misiones()
+        self._last_pending_ids = _actualizar_listbox(
+            self.queue_listbox,
+            self._last_pending_ids,
+            vista['pendientes_ids'],
+            vista['pendientes_filas']
+        )
 
-            self.history_listbox.delete(0, tk.END)
-            for m in data.get('misiones_completadas', []):
-                self.history_listbox.insert(tk.END, f"{m['id']}: {m['titulo']} (XP: {m['xp']})")
+        history_ids = vista['historial_ids']
+        if history_ids != self._last_history_ids:
+            self.history_listbox.set_data(vista['historial_filas'])
+            self._last_history_ids = history_ids
 
-            misiones_disponibles = [
-                f"{m['id']}: {m['titulo']}" 
-                for m in data.get('misiones_disponibles', [])
-            ]
+        misiones_disponibles = vista['disponibles']
+        if misiones_disponibles != self._last_combo_values:
             self.mission_combobox['values'] = misiones_disponibles
             self.mission_combobox.set('')
+            if not misiones_disponibles:
+                self.mission_combobox.set('No hay misiones disponibles')
+            self._last_combo_values = misiones_disponibles
 
-            mision_activa = data.get('mision_activa')
-            if mision_activa:
-                self.current_mission_label.config(text=f"{mision_activa['titulo']} (XP: {mision_activa['xp']})")
-            else:
-                self.current_mission_label.config(text="Ninguna misión activa")
-                
-        except Exception as e:
-            messagebox.showerror("Error", f"Error al actualizar misiones: {str(e)}")
+        texto = vista['mision_activa']
+        if texto != self._last_mission_text:
+            self.current_mission_label.config(text=texto)
+            self._last_mission_text = texto
+
+        self._personaje_mostrado = personaje_id
+        self._etag_mostrado = vista['etag']
 
     def completar_mision_actual(self):
         """Marca la misión actual como completada
         
         Realiza petición POST al endpoint de completar misión.
         Muestra XP ganada y total.
-        Actualiza la información de misiones.
+        Actualiza la lista de personajes y la información de misiones.
         """
         if not self.selected_char_id:
             messagebox.showerror("Error", "Selecciona un personaje primero")
             return
             
-        try:
-            res = requests.post(f"{BASE_URL}/personajes/{self.selected_char_id}/completar")
-            result = res.json()
-            messagebox.showinfo("Misión completada", f"XP ganada: {result['xp_ganada']}\nXP total: {result['xp_total']}")
-            self.actualizar_misiones()
-        except Exception as e:
-            messagebox.showerror("Error", f"No se pudo completar: {str(e)}")
+        personaje_id = self.selected_char_id
+
+        def al_completar(result):
+            try:
+                self._flash(f"Misión completada - XP ganada: {result['xp_ganada']} - XP total: {result['xp_total']}")
+                # La XP cambió: recargar personajes y misiones en paralelo
+                self.actualizar_personajes()
+                self._programar_actualizacion()
+            except Exception as e:
+                messagebox.showerror("Error", f"No se pudo completar: {str(e)}")
+
+        self._en_segundo_plano(
+            lambda: orjson.loads(self.http.post(f"{BASE_URL}/personajes/{personaje_id}/completar", timeout=TIMEOUT).content),
+            al_completar,
+            "No se pudo completar"
+        )
 
     def aceptar_mision(self):
         """Acepta una misión del combobox y la añade a la cola
@@ -267,34 +654,32 @@ class RPGApp:
             
         try:
             mission_id = int(selected.split(':')[0])
-            res = requests.post(
-                f"{BASE_URL}/personajes/{self.selected_char_id}/misiones/{mission_id}"
-            )
-            
+        except ValueError:
+            messagebox.showerror("Error", "ID de misión inválido")
+            return
+
+        personaje_id = self.selected_char_id
+
+        def al_aceptar(res):
             if res.status_code == 200:
-                messagebox.showinfo("Éxito", "Misión aceptada y añadida a la cola")
-                self.actualizar_misiones()
-                self.mission_combobox.set('')
-                data = requests.get(f"{BASE_URL}/personajes/{self.selected_char_id}/misiones").json()
-                
-                self.queue_listbox.delete(0, tk.END)
-                for m in data.get('misiones_pendientes', []):
-                    self.queue_listbox.insert(tk.END, f"{m['id']}: {m['titulo']} (XP: {m['xp']})")
-                
-                self.mission_combobox['values'] = [
-                    f"{m['id']}: {m['titulo']}" 
-                    for m in data.get('misiones_disponibles', [])
-                ]
-                if not self.mission_combobox['values']:
-                    self.mission_combobox.set('No hay misiones disponibles')
+                self._flash("Misión aceptada y añadida a la cola")
+                # Una sola recarga de misiones refresca cola y combobox
+                self._programar_actualizacion()
             else:
-                error_detail = res.json().get('detail', res.text)
+                try:
+                    error_detail = orjson.loads(res.content).get('detail', res.text)
+                except ValueError:
+                    error_detail = res.text
                 messagebox.showerror("Error", f"No se pudo aceptar la misión: {error_detail}")
-                
-        except ValueError:
-            messagebox.showerror("Error", "ID de misión inválido")
-        except Exception as e:
-            messagebox.showerror("Error", f"Error inesperado: {str(e)}")
+
+        self._en_segundo_plano(
+            lambda: self.http.post(
+                f"{BASE_URL}/personajes/{personaje_id}/misiones/{mission_id}",
+                timeout=TIMEOUT
+            ),
+            al_aceptar,
+            "Error inesperado"
+        )
 
     def crear_mision(self):
         """Crea una nueva misión con los datos del formulario
@@ -304,29 +689,36 @@ class RPGApp:
         Limpia formulario y actualiza lista si tiene éxito.
         Maneja errores de validación.
         """
-        titulo = self.titulo_entry.get()
-        xp = self.xp_entry.get()
+        titulo = self.titulo_entry.get().strip()
+        xp = self.xp_entry.get().strip()
         
         if titulo and xp:
             try:
                 xp_int = int(xp)
-                res = requests.post(
-                    f"{BASE_URL}/misiones",
-                    params={"titulo": titulo, "xp": xp_int}
-                )
-                
+            except ValueError:
+                messagebox.showerror("Error", "XP debe ser un número")
+                return
+
+            cuerpo = orjson.dumps({"titulo": titulo, "xp": xp_int})
+
+            def al_crear(res):
                 if res.status_code == 200:
-                    messagebox.showinfo("Éxito", "Misión creada")
+                    self._flash("Misión creada")
                     self.titulo_entry.delete(0, tk.END)
                     self.xp_entry.delete(0, tk.END)
-                    self.actualizar_misiones()
+                    self._programar_actualizacion()
                 else:
                     messagebox.showerror("Error", f"No se pudo crear: {res.text}")
-                    
-            except ValueError:
-                messagebox.showerror("Error", "XP debe ser un número")
-            except Exception as e:
-                messagebox.showerror("Error", f"Error al crear: {str(e)}")
+
+            self._en_segundo_plano(
+                lambda: self.http.post(
+                    f"{BASE_URL}/misiones",
+                    data=cuerpo,
+                    timeout=TIMEOUT
+                ),
+                al_crear,
+                "Error al crear"
+            )
         else:
             messagebox.showerror("Error", "Título y XP son requeridos")
 